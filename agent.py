@@ -7,15 +7,23 @@ capabilities, and an iptables firewall that only allows moltbook.com
 and the LLM sidecar.
 """
 
-import json
+import asyncio
+import functools
+import hashlib
+import math
 import os
 import random
 import re
 import signal
 import sys
 import time
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 
-import requests
+import diskcache
+import httpx
+import orjson
 
 # ---------------------------------------------------------------------------
 # Globals
@@ -23,15 +31,16 @@ import requests
 
 MOLTBOOK_BASE = "https://www.moltbook.com/api"
 
-_shutdown = False
+_shutdown_event = asyncio.Event()
 
 
-def _handle_signal(signum, _frame):
-    global _shutdown
+def _handle_signal(signum, _frame=None):
     print(f"\n[agent] received signal {signum}, shutting down …")
-    _shutdown = True
+    _shutdown_event.set()
 
 
+# Pre-loop registration; _main_async re-registers through the event loop
+# so a signal also wakes any pending await immediately.
 signal.signal(signal.SIGTERM, _handle_signal)
 signal.signal(signal.SIGINT, _handle_signal)
 
@@ -49,6 +58,7 @@ DEFAULT_CONFIG = {
     "vote_probability": 0.7,
     "temperature": 0.7,
     "max_tokens": 256,
+    "max_retry_after_seconds": 60,
 }
 
 
@@ -59,8 +69,8 @@ def load_config() -> dict:
     config_path = os.environ.get("AGENT_CONFIG", "/etc/agent/config.json")
     if os.path.isfile(config_path):
         print(f"[agent] loading config from {config_path}")
-        with open(config_path) as f:
-            cfg.update(json.load(f))
+        with open(config_path, "rb") as f:
+            cfg.update(orjson.loads(f.read()))
     else:
         print(f"[agent] no config file at {config_path}, using defaults")
 
@@ -75,6 +85,9 @@ def load_config() -> dict:
         print("[agent] ERROR: MOLTBOOK_API_KEY is not set", file=sys.stderr)
         sys.exit(1)
 
+    global _retry_after_cap
+    _retry_after_cap = float(cfg.get("max_retry_after_seconds", 60))
+
     return cfg
 
 
@@ -83,87 +96,370 @@ def load_config() -> dict:
 # ---------------------------------------------------------------------------
 
 
-def _session(cfg: dict) -> requests.Session:
-    s = requests.Session()
-    s.headers.update(
-        {
+def _api_client(cfg: dict) -> httpx.AsyncClient:
+    """Pooled client for the moltbook API, auth headers pre-set."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=15,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        headers={
             "Authorization": f"Bearer {cfg['api_key']}",
             "Content-Type": "application/json",
-        }
+        },
     )
-    return s
-
-
-def api_get(session: requests.Session, path: str, params: dict | None = None):
-    """GET from the moltbook API with rate-limit handling."""
-    url = f"{MOLTBOOK_BASE}{path}"
-    for attempt in range(3):
-        resp = session.get(url, params=params, timeout=15)
-        if resp.status_code == 429:
-            wait = int(resp.headers.get("Retry-After", 5))
-            print(f"[agent] rate-limited, waiting {wait}s …")
-            _interruptible_sleep(wait)
+
+
+# Cap on how long any Retry-After / backoff wait may block a cycle.
+# Overridden from config ("max_retry_after_seconds") in load_config.
+_retry_after_cap = 60.0
+
+_BACKOFF_BASE = 2.0
+
+
+def _parse_retry_after(hdr: str | None) -> float | None:
+    """Parse a Retry-After header — delay-seconds or HTTP-date — capped."""
+    if not hdr:
+        return None
+    try:
+        return min(_retry_after_cap, max(0.0, float(int(hdr))))
+    except ValueError:
+        pass
+    try:
+        dt = parsedate_to_datetime(hdr)
+        return min(_retry_after_cap, max(0.0, dt.timestamp() - time.time()))
+    except (TypeError, ValueError):
+        return None
+
+
+async def _request_with_retries(
+    client: httpx.AsyncClient, method: str, url: str, **kwargs
+):
+    """Issue a request, retrying 429/503 with Retry-After or jittered backoff."""
+    for attempt in range(5):
+        resp = await client.request(method, url, **kwargs)
+        if resp.status_code in (429, 503):
+            wait = _parse_retry_after(resp.headers.get("Retry-After"))
+            if wait is None:
+                # No server hint — exponential backoff with jitter so
+                # retries don't stampede the instant the server recovers.
+                wait = min(
+                    _retry_after_cap, _BACKOFF_BASE * 2**attempt
+                ) + random.uniform(0, _BACKOFF_BASE)
+            print(f"[agent] got {resp.status_code}, retrying in {wait:.1f}s …")
+            await _interruptible_sleep(wait)
+            if _shutdown_event.is_set():
+                return None
             continue
+        # 304 is a conditional-GET cache hit, not an error — httpx
+        # raise_for_status rejects any non-2xx, unlike requests
+        if resp.status_code == 304 or resp.is_success:
+            return resp
         resp.raise_for_status()
-        return resp.json()
-    print("[agent] WARNING: gave up after 3 rate-limit retries", file=sys.stderr)
+        return resp
+    print("[agent] WARNING: gave up after 5 retries", file=sys.stderr)
     return None
 
 
-def api_post(session: requests.Session, path: str, body: dict):
-    """POST to the moltbook API with rate-limit handling."""
-    url = f"{MOLTBOOK_BASE}{path}"
-    for attempt in range(3):
-        resp = session.post(url, json=body, timeout=15)
-        if resp.status_code == 429:
-            wait = int(resp.headers.get("Retry-After", 5))
-            print(f"[agent] rate-limited, waiting {wait}s …")
-            _interruptible_sleep(wait)
-            continue
-        resp.raise_for_status()
-        return resp.json()
-    print("[agent] WARNING: gave up after 3 rate-limit retries", file=sys.stderr)
+# Conditional-request cache for GETs: (path, params) -> last known ETag,
+# parsed body, and server-granted freshness window. Keyspace is bounded
+# by the configured topics/submolts.
+_etag_cache: dict = {}
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _etag_key(path: str, params: dict | None):
+    return (path, frozenset((params or {}).items()))
+
+
+def _parse_max_age(cache_control: str | None) -> float:
+    """Freshness window from Cache-Control, 0 if none granted."""
+    if not cache_control or "no-store" in cache_control or "no-cache" in cache_control:
+        return 0.0
+    m = _MAX_AGE_RE.search(cache_control)
+    return float(m.group(1)) if m else 0.0
+
+
+def _etag_fresh(key) -> dict | None:
+    """Return the cached body if still within its freshness window."""
+    cached = _etag_cache.get(key)
+    if cached and time.time() - cached["fetched_at"] < cached["max_age"]:
+        return cached["body"]
     return None
 
 
+def _etag_store(key, resp, body) -> None:
+    etag = resp.headers.get("ETag")
+    max_age = _parse_max_age(resp.headers.get("Cache-Control"))
+    if etag or max_age:
+        _etag_cache[key] = {
+            "etag": etag,
+            "body": body,
+            "fetched_at": time.time(),
+            "max_age": max_age,
+        }
+
+
+async def api_get(client: httpx.AsyncClient, path: str, params: dict | None = None):
+    """GET from the moltbook API with rate-limiting and conditional requests.
+
+    Within the server's max-age window the request is skipped entirely;
+    past it, If-None-Match lets the server answer 304 with no body.
+    """
+    key = _etag_key(path, params)
+    fresh = _etag_fresh(key)
+    if fresh is not None:
+        return fresh
+
+    cached = _etag_cache.get(key)
+    headers = None
+    if cached and cached["etag"]:
+        headers = {"If-None-Match": cached["etag"]}
+
+    resp = await _request_with_retries(
+        client, "GET", f"{MOLTBOOK_BASE}{path}", params=params, headers=headers
+    )
+    if resp is None:
+        return None
+    if resp.status_code == 304:
+        if cached:
+            cached["fetched_at"] = time.time()
+            return cached["body"]
+        # 304 with nothing cached (shouldn't happen) — no body to parse
+        return None
+    data = orjson.loads(resp.content)
+    _etag_store(key, resp, data)
+    return data
+
+
+async def api_post(client: httpx.AsyncClient, path: str, body: dict):
+    """POST to the moltbook API with rate-limit handling."""
+    resp = await _request_with_retries(
+        client, "POST", f"{MOLTBOOK_BASE}{path}", content=orjson.dumps(body)
+    )
+    return orjson.loads(resp.content) if resp is not None else None
+
+
 # ---------------------------------------------------------------------------
 # LLM client (OpenAI-compatible)
 # ---------------------------------------------------------------------------
 
 
-def wait_for_llm(cfg: dict, retries: int = 60, delay: int = 5):
+def _llm_client() -> httpx.AsyncClient:
+    """Pooled client for the LLM sidecar (plain HTTP/1.1, long timeout)."""
+    return httpx.AsyncClient(
+        timeout=120,
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
+
+
+async def wait_for_llm(
+    client: httpx.AsyncClient, cfg: dict, retries: int = 60, delay: int = 5
+):
     """Block until the LLM endpoint is reachable."""
     # Derive a health-check URL from the chat completions URL
     base = cfg["llm_url"].rsplit("/v1/", 1)[0]
     for i in range(retries):
-        if _shutdown:
+        if _shutdown_event.is_set():
             sys.exit(0)
         try:
-            requests.get(base, timeout=3)
+            resp = await client.get(base, timeout=3)
+            if resp.status_code == 503:
+                wait = _parse_retry_after(resp.headers.get("Retry-After"))
+                if wait is None:
+                    wait = min(
+                        _retry_after_cap, _BACKOFF_BASE * 2**i
+                    ) + random.uniform(0, _BACKOFF_BASE)
+                print(f"[agent] LLM returned 503, retrying in {wait:.1f}s …")
+                await _interruptible_sleep(wait)
+                continue
             print("[agent] LLM is reachable")
             return
-        except requests.ConnectionError:
+        except httpx.TransportError:
             print(f"[agent] waiting for LLM ({i + 1}/{retries}) …")
-            _interruptible_sleep(delay)
+            await _interruptible_sleep(delay)
     print("[agent] ERROR: LLM not reachable", file=sys.stderr)
     sys.exit(1)
 
 
-def llm_chat(cfg: dict, messages: list[dict]) -> str:
-    """Send a chat completion request and return the assistant's reply."""
-    resp = requests.post(
+class _BraceTracker:
+    """Track JSON brace depth across streamed chunks, string-aware.
+
+    feed() returns True once the outermost object closes — everything
+    after that is trailing chatter we don't need to wait for.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        for ch in chunk:
+            if self.escaped:
+                self.escaped = False
+                continue
+            if self.in_string:
+                if ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+                continue
+            if ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}":
+                # Ignore stray closers before/outside any object so
+                # preamble text can't end the stream mid-JSON
+                if self.depth > 0:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        return True
+        return False
+
+
+async def llm_chat(
+    client: httpx.AsyncClient,
+    cfg: dict,
+    messages: list[dict],
+    max_tokens: int | None = None,
+    json_mode: bool = False,
+) -> str:
+    """Send a chat completion request and return the assistant's reply.
+
+    Decode time scales with tokens generated, so callers pass a
+    max_tokens budget sized to their task instead of the global default.
+    The reply is streamed and the connection closed as soon as the
+    outer JSON object completes, instead of waiting out the full decode.
+    """
+    payload = {
+        "model": cfg["model"],
+        "messages": messages,
+        "temperature": cfg.get("temperature", 0.7),
+        "max_tokens": max_tokens or cfg.get("max_tokens", 256),
+        "stream": True,
+        # Ollama: keep the model (and its prefill KV cache) resident
+        # between cycles instead of unloading after 5 idle minutes.
+        # Other OpenAI-compatible backends ignore the extra field.
+        "keep_alive": "30m",
+    }
+    if json_mode:
+        payload["response_format"] = {"type": "json_object"}
+
+    chunks = []
+    tracker = _BraceTracker()
+    async with client.stream(
+        "POST",
         cfg["llm_url"],
-        json={
-            "model": cfg["model"],
-            "messages": messages,
-            "temperature": cfg.get("temperature", 0.7),
-            "max_tokens": cfg.get("max_tokens", 256),
-            "stream": False,
-        },
-        timeout=120,
+        content=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+    ) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            try:
+                delta = orjson.loads(data)["choices"][0]["delta"].get("content")
+            except (orjson.JSONDecodeError, KeyError, IndexError):
+                continue
+            if not delta:
+                continue
+            chunks.append(delta)
+            if tracker.feed(delta):
+                break
+    return "".join(chunks)
+
+
+LLM_CACHE_DIR = os.environ.get("LLM_CACHE_DIR", "/var/cache/agent/llm")
+
+
+class LLMCache:
+    """Size-bounded LRU cache for LLM replies, persisted to disk.
+
+    Keyed on (model, system prompt, user message) so identical prompts
+    across cycles skip the HTTP round trip and token generation entirely.
+    Backed by diskcache (sqlite + LRU eviction) so a container restart
+    starts with yesterday's hit rate instead of a cold cache; if the
+    cache directory isn't writable the cache lands in a temp dir and
+    simply doesn't survive restarts.
+    """
+
+    def __init__(
+        self,
+        directory: str = LLM_CACHE_DIR,
+        size_limit: int = 256 * 1024 * 1024,
+        ttl: int = 3600,
+    ):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        try:
+            self._cache = diskcache.Cache(
+                directory,
+                size_limit=size_limit,
+                eviction_policy="least-recently-used",
+            )
+        except OSError as e:
+            print(
+                f"[agent] WARNING: cache dir {directory} unavailable ({e}), "
+                f"using a temp dir",
+                file=sys.stderr,
+            )
+            self._cache = diskcache.Cache(
+                size_limit=size_limit, eviction_policy="least-recently-used"
+            )
+
+    @staticmethod
+    def key(cfg: dict, system: str, user: str) -> str:
+        payload = orjson.dumps(
+            {"model": cfg["model"], "system": system, "user": user},
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        reply = self._cache.get(key)
+        if reply is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return reply
+
+    def put(self, key: str, reply: str, ttl: int | None = None):
+        self._cache.set(key, reply, expire=ttl if ttl is not None else self.ttl)
+
+
+_llm_cache = LLMCache()
+
+
+async def cached_llm_chat(
+    client: httpx.AsyncClient,
+    cfg: dict,
+    messages: list[dict],
+    ttl: int = 3600,
+    max_tokens: int | None = None,
+    json_mode: bool = False,
+) -> str:
+    """llm_chat wrapper that short-circuits on a cache hit."""
+    system = next((m["content"] for m in messages if m["role"] == "system"), "")
+    user = next((m["content"] for m in messages if m["role"] == "user"), "")
+    key = LLMCache.key(cfg, system, user)
+    cached = _llm_cache.get(key)
+    if cached is not None:
+        print(
+            f"[agent] LLM cache hit "
+            f"({_llm_cache.hits} hits / {_llm_cache.misses} misses)"
+        )
+        return cached
+    reply = await llm_chat(
+        client, cfg, messages, max_tokens=max_tokens, json_mode=json_mode
     )
-    resp.raise_for_status()
-    return resp.json()["choices"][0]["message"]["content"]
+    _llm_cache.put(key, reply, ttl=ttl)
+    return reply
 
 
 # ---------------------------------------------------------------------------
@@ -171,26 +467,31 @@ def llm_chat(cfg: dict, messages: list[dict]) -> str:
 # ---------------------------------------------------------------------------
 
 
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+_BRACE_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
 def _parse_llm_json(text: str) -> dict | None:
     """Extract JSON from LLM output, handling markdown fences and preamble."""
     # Try the raw text first
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         pass
-    # Strip markdown code fences
-    m = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", text, re.DOTALL)
-    if m:
-        try:
-            return json.loads(m.group(1))
-        except json.JSONDecodeError:
-            pass
+    # Strip markdown code fences (skip the regex when there are none)
+    if "```" in text:
+        m = _FENCE_RE.search(text)
+        if m:
+            try:
+                return orjson.loads(m.group(1))
+            except orjson.JSONDecodeError:
+                pass
     # Find first { … } block
-    m = re.search(r"\{.*\}", text, re.DOTALL)
+    m = _BRACE_RE.search(text)
     if m:
         try:
-            return json.loads(m.group(0))
-        except json.JSONDecodeError:
+            return orjson.loads(m.group(0))
+        except orjson.JSONDecodeError:
             pass
     return None
 
@@ -215,25 +516,76 @@ Rules:
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _system_prompt_cached(persona: str, topics: tuple[str, ...]) -> str:
+    return SYSTEM_PROMPT_TEMPLATE.format(persona=persona, topics=", ".join(topics))
+
+
 def _system_prompt(cfg: dict) -> str:
-    return SYSTEM_PROMPT_TEMPLATE.format(
-        persona=cfg.get("persona", DEFAULT_CONFIG["persona"]),
-        topics=", ".join(cfg.get("topics", DEFAULT_CONFIG["topics"])),
+    # Config is immutable during the loop, so this renders exactly once
+    # and every caller sees the same string object.
+    return _system_prompt_cached(
+        cfg.get("persona", DEFAULT_CONFIG["persona"]),
+        tuple(cfg.get("topics", DEFAULT_CONFIG["topics"])),
     )
 
 
-def discover_posts(
-    session: requests.Session, cfg: dict, engaged_ids: set
+class EngagedIds:
+    """Insertion-ordered set of engaged post ids, capped in size.
+
+    The agent runs for weeks; an unbounded set would grow forever. Old
+    ids are evicted FIFO once the cap is hit — the feeds only surface
+    recent posts, so forgetting month-old ids is harmless.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._ids: OrderedDict = OrderedDict()
+
+    def __contains__(self, pid) -> bool:
+        return pid in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, pid):
+        self._ids[pid] = None
+        self._ids.move_to_end(pid)
+        while len(self._ids) > self.max_entries:
+            self._ids.popitem(last=False)
+
+
+async def discover_posts(
+    client: httpx.AsyncClient, cfg: dict, engaged_ids: EngagedIds
 ) -> list[dict]:
-    """Find posts to engage with via topic search and feed browsing."""
+    """Find posts to engage with via topic search and feed browsing.
+
+    The GETs are independent, so they run concurrently — discovery
+    latency is bounded by the slowest response instead of the sum.
+    """
+    # Search by each topic, plus the hot + new feed of each submolt
+    requests_to_make = [
+        ("/search", {"q": topic, "limit": 5}) for topic in cfg.get("topics", [])
+    ]
+    for sort in ("hot", "new"):
+        for submolt in cfg.get("submolts", ["general"]):
+            requests_to_make.append(
+                ("/feed", {"submolt": submolt, "sort": sort, "limit": 10})
+            )
+
+    # api_get brings the retry/backoff handling and the conditional-
+    # request cache along; gather keeps the calls concurrent
+    bodies = await asyncio.gather(
+        *[api_get(client, path, params) for path, params in requests_to_make],
+        return_exceptions=True,
+    )
+
     posts = []
     seen = set()
-
-    # Search by each topic
-    for topic in cfg.get("topics", []):
-        if _shutdown:
-            return posts
-        data = api_get(session, "/search", params={"q": topic, "limit": 5})
+    for data in bodies:
+        if isinstance(data, Exception):
+            print(f"[agent] discovery request failed: {data}", file=sys.stderr)
+            continue
         if data and "posts" in data:
             for p in data["posts"]:
                 pid = p.get("id")
@@ -241,72 +593,152 @@ def discover_posts(
                     posts.append(p)
                     seen.add(pid)
 
-    # Fallback / supplement: hot + new feed
-    for sort in ("hot", "new"):
-        if _shutdown:
-            return posts
-        for submolt in cfg.get("submolts", ["general"]):
-            data = api_get(
-                session,
-                "/feed",
-                params={"submolt": submolt, "sort": sort, "limit": 10},
-            )
-            if data and "posts" in data:
-                for p in data["posts"]:
-                    pid = p.get("id")
-                    if pid and pid not in engaged_ids and pid not in seen:
-                        posts.append(p)
-                        seen.add(pid)
-
     return posts
 
 
-def pick_and_act(
-    session: requests.Session, cfg: dict, posts: list[dict], engaged_ids: set
-) -> int:
-    """Present candidate posts to the LLM and execute its chosen actions."""
-    if not posts:
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s")
+_URL_RE = re.compile(r"https?://\S+")
+_CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+
+
+def _summarize_body(body: str) -> str:
+    """First sentence of a post body, URLs/code stripped, ≤120 chars.
+
+    The LLM only needs enough to decide whether a post is worth
+    engaging with; full bodies are pure prefill cost.
+    """
+    body = _CODE_BLOCK_RE.sub("", body)
+    body = _URL_RE.sub("", body)
+    body = " ".join(body.split())
+    return _SENTENCE_SPLIT_RE.split(body, maxsplit=1)[0][:120]
+
+
+def _engagement_score(p: dict, topics: list[str], now: float) -> float:
+    """Cheap local relevance score: topic overlap, popularity, recency."""
+    text = f"{p.get('title') or ''} {p.get('body') or ''}".lower()
+    score = float(sum(topic.lower() in text for topic in topics))
+    score += math.log1p(max(p.get("score") or 0, 0))
+    created = p.get("created_at")
+    if created:
+        try:
+            ts = datetime.fromisoformat(
+                str(created).replace("Z", "+00:00")
+            ).timestamp()
+            score -= 0.1 * max(0.0, (now - ts) / 3600)
+        except ValueError:
+            pass
+    return score
+
+
+def _wants_new_post(cfg: dict, last_post_time: float) -> bool:
+    """Gate post creation: 30-min cooldown, ~30% chance, config cap."""
+    if time.time() - last_post_time < 1800:
+        return False
+    if random.random() > 0.3:
+        return False
+    return cfg.get("max_posts_per_cycle", 1) >= 1
+
+
+async def decide_and_act(
+    api_client: httpx.AsyncClient,
+    llm_client: httpx.AsyncClient,
+    cfg: dict,
+    posts: list[dict],
+    engaged_ids: EngagedIds,
+    last_post_time: float,
+) -> tuple[int, float]:
+    """Ask the LLM for all of this cycle's decisions in one completion.
+
+    Engagement actions and (when the creation gate fires) an original
+    post share a single chat request, so active cycles pay one LLM
+    round trip instead of two. Returns (actions_taken, last_post_time).
+    """
+    include_post = _wants_new_post(cfg, last_post_time)
+
+    if not posts and not include_post:
         print("[agent] no candidate posts this cycle")
-        return 0
+        return 0, last_post_time
 
     max_comments = cfg.get("max_comments_per_cycle", 3)
 
-    # Build numbered list for the LLM
-    candidates = ""
-    for i, p in enumerate(posts[:15]):  # Cap at 15 candidates
-        title = p.get("title", "(no title)")
-        body = (p.get("body") or "")[:200]
+    # Rank candidates locally and send only the best few — the LLM
+    # decides how to engage, not which posts are worth reading
+    if posts:
+        now = time.time()
+        topics = cfg.get("topics", DEFAULT_CONFIG["topics"])
+        posts = sorted(
+            posts, key=lambda p: _engagement_score(p, topics, now), reverse=True
+        )[:5]
+
+    # Build a compact numbered list for the LLM — one line per post,
+    # first sentence only
+    candidate_lines = []
+    for i, p in enumerate(posts):
+        title = (p.get("title") or "(no title)")[:80]
+        short_body = _summarize_body(p.get("body") or "")
         author = p.get("author", {}).get("username", "unknown")
-        candidates += f"\n{i + 1}. [{author}] {title}\n   {body}\n"
-
-    user_msg = (
-        f"Here are posts on moltbook.com. Pick up to {max_comments} to engage with.\n"
-        f"For each, choose an action: 'comment' (with your comment text) or 'upvote'.\n"
-        f"Respond with JSON: {{\"actions\": [{{\"index\": 1, \"action\": \"comment\", "
-        f'"comment": "your comment"}}]}}\n'
-        f"Only include posts you genuinely want to engage with.\n"
-        f"\n{candidates}"
-    )
+        candidate_lines.append(f"{i + 1}|{author}|{title}|{short_body}\n")
+    candidates = "".join(candidate_lines)
+
+    # Fixed instructions first, variable candidates block last
+    user_msg = ""
+    schema = ""
+    if posts:
+        user_msg += (
+            f"Here are posts on moltbook.com. Pick up to {max_comments} to engage with.\n"
+            f"For each, choose an action: 'comment' (with your comment text) or 'upvote'.\n"
+            f"Only include posts you genuinely want to engage with.\n"
+            f"Each candidate line is: index|author|title|summary.\n"
+        )
+        schema = '"actions": [{"index": 1, "action": "comment", "comment": "your comment"}]'
+    if include_post:
+        topic = random.choice(cfg.get("topics", DEFAULT_CONFIG["topics"]))
+        submolt = random.choice(cfg.get("submolts", ["general"]))
+        user_msg += (
+            f"Also write one original post for the '{submolt}' community "
+            f"about {topic}. Keep it concise and interesting.\n"
+        )
+        if schema:
+            schema += ", "
+        schema += '"new_post": {"title": "your title", "body": "your post body"}'
+    user_msg += f"Respond with JSON: {{{schema}}}\n"
+    if candidates:
+        user_msg += f"\n{candidates}"
 
     messages = [
         {"role": "system", "content": _system_prompt(cfg)},
         {"role": "user", "content": user_msg},
     ]
 
+    # Rough per-task reply budget: ~60 tokens per engagement action,
+    # ~180 for an original post
+    reply_budget = (60 * max_comments if posts else 0) + (180 if include_post else 0)
+
     try:
-        reply = llm_chat(cfg, messages)
+        if include_post:
+            # Never serve post creation from the reply cache — a hit
+            # would publish a byte-identical duplicate post
+            reply = await llm_chat(
+                llm_client, cfg, messages, max_tokens=reply_budget, json_mode=True
+            )
+        else:
+            reply = await cached_llm_chat(
+                llm_client, cfg, messages, max_tokens=reply_budget, json_mode=True
+            )
     except Exception as e:
-        print(f"[agent] LLM error during pick_and_act: {e}", file=sys.stderr)
-        return 0
+        print(f"[agent] LLM error during decide_and_act: {e}", file=sys.stderr)
+        return 0, last_post_time
 
     parsed = _parse_llm_json(reply)
-    if not parsed or "actions" not in parsed:
+    if not parsed or ("actions" not in parsed and "new_post" not in parsed):
         print(f"[agent] could not parse LLM response: {reply[:200]}")
-        return 0
+        return 0, last_post_time
 
-    actions_taken = 0
-    for action in parsed["actions"]:
-        if _shutdown:
+    # Plan all POSTs first, then run them concurrently — each is an
+    # independent round trip, so total latency is the slowest one
+    planned = []
+    for action in parsed.get("actions") or []:
+        if _shutdown_event.is_set():
             break
         idx = action.get("index")
         if not isinstance(idx, int) or idx < 1 or idx > len(posts):
@@ -318,14 +750,10 @@ def pick_and_act(
 
         if act == "comment":
             comment_text = action.get("comment", "").strip()
-            if not comment_text:
-                continue
-            try:
-                api_post(session, f"/posts/{pid}/comments", {"body": comment_text})
-                print(f"[agent] commented on post {pid}: {comment_text[:80]}")
-                actions_taken += 1
-            except Exception as e:
-                print(f"[agent] failed to comment on {pid}: {e}", file=sys.stderr)
+            if comment_text:
+                planned.append(
+                    ("comment", pid, f"/posts/{pid}/comments", {"body": comment_text})
+                )
 
         if act in ("comment", "upvote"):
             # Upvote based on probability (always upvote if commenting)
@@ -333,74 +761,47 @@ def pick_and_act(
                 "vote_probability", 0.7
             )
             if should_vote:
-                try:
-                    api_post(session, f"/posts/{pid}/upvote", {})
-                    print(f"[agent] upvoted post {pid}")
-                except Exception as e:
-                    print(f"[agent] failed to upvote {pid}: {e}", file=sys.stderr)
+                planned.append(("upvote", pid, f"/posts/{pid}/upvote", {}))
 
         engaged_ids.add(pid)
 
-    return actions_taken
-
-
-def maybe_create_post(
-    session: requests.Session, cfg: dict, last_post_time: float
-) -> float:
-    """Occasionally create an original post. Returns updated last_post_time."""
-    # Respect cooldown (30 min)
-    if time.time() - last_post_time < 1800:
-        return last_post_time
-
-    # ~30% chance per cycle
-    if random.random() > 0.3:
-        return last_post_time
-
-    max_posts = cfg.get("max_posts_per_cycle", 1)
-    if max_posts < 1:
-        return last_post_time
-
-    topics = cfg.get("topics", DEFAULT_CONFIG["topics"])
-    topic = random.choice(topics)
-    submolt = random.choice(cfg.get("submolts", ["general"]))
-
-    user_msg = (
-        f"Write an original post for the '{submolt}' community on moltbook.com "
-        f"about {topic}. Keep it concise and interesting.\n"
-        f'Respond with JSON: {{"title": "your title", "body": "your post body"}}'
-    )
-
-    messages = [
-        {"role": "system", "content": _system_prompt(cfg)},
-        {"role": "user", "content": user_msg},
-    ]
-
-    try:
-        reply = llm_chat(cfg, messages)
-    except Exception as e:
-        print(f"[agent] LLM error during post creation: {e}", file=sys.stderr)
-        return last_post_time
+    actions_taken = 0
+    if planned:
+        results = await asyncio.gather(
+            *[api_post(api_client, path, body) for _kind, _pid, path, body in planned],
+            return_exceptions=True,
+        )
+        for (kind, pid, _path, body), result in zip(planned, results):
+            if isinstance(result, Exception):
+                print(f"[agent] failed to {kind} on {pid}: {result}", file=sys.stderr)
+                continue
+            if kind == "comment":
+                print(f"[agent] commented on post {pid}: {body['body'][:80]}")
+                actions_taken += 1
+            else:
+                print(f"[agent] upvoted post {pid}")
 
-    parsed = _parse_llm_json(reply)
-    if not parsed or "title" not in parsed or "body" not in parsed:
-        print(f"[agent] could not parse post response: {reply[:200]}")
-        return last_post_time
+    new_post = parsed.get("new_post") if include_post else None
+    if new_post and not _shutdown_event.is_set():
+        if "title" in new_post and "body" in new_post:
+            try:
+                await api_post(
+                    api_client,
+                    "/posts",
+                    {
+                        "title": new_post["title"],
+                        "body": new_post["body"],
+                        "submolt": submolt,
+                    },
+                )
+                print(f"[agent] created post: {new_post['title'][:80]}")
+                last_post_time = time.time()
+            except Exception as e:
+                print(f"[agent] failed to create post: {e}", file=sys.stderr)
+        else:
+            print(f"[agent] could not parse post response: {reply[:200]}")
 
-    try:
-        api_post(
-            session,
-            "/posts",
-            {
-                "title": parsed["title"],
-                "body": parsed["body"],
-                "submolt": submolt,
-            },
-        )
-        print(f"[agent] created post: {parsed['title'][:80]}")
-        return time.time()
-    except Exception as e:
-        print(f"[agent] failed to create post: {e}", file=sys.stderr)
-        return last_post_time
+    return actions_taken, last_post_time
 
 
 # ---------------------------------------------------------------------------
@@ -408,12 +809,12 @@ def maybe_create_post(
 # ---------------------------------------------------------------------------
 
 
-def _interruptible_sleep(seconds: int):
-    """Sleep in 1-second increments so we can respond to SIGTERM quickly."""
-    for _ in range(seconds):
-        if _shutdown:
-            return
-        time.sleep(1)
+async def _interruptible_sleep(seconds: float):
+    """Sleep until the timeout or the shutdown event, whichever is first."""
+    try:
+        await asyncio.wait_for(_shutdown_event.wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -421,58 +822,64 @@ def _interruptible_sleep(seconds: int):
 # ---------------------------------------------------------------------------
 
 
-def main():
+async def _main_async():
     cfg = load_config()
 
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, _handle_signal, sig)
+
     print(f"[agent] model  : {cfg['model']}")
     print(f"[agent] llm    : {cfg['llm_url']}")
     print(f"[agent] persona: {cfg.get('persona', '')[:60]}")
     print(f"[agent] topics : {', '.join(cfg.get('topics', []))}")
     print()
 
-    wait_for_llm(cfg)
+    async with _llm_client() as llm_client, _api_client(cfg) as api_client:
+        await wait_for_llm(llm_client, cfg)
 
-    # Verify moltbook auth
-    session = _session(cfg)
-    try:
-        me = api_get(session, "/agents/me")
-        if me:
-            print(f"[agent] authenticated as: {me.get('username', '?')}")
-        else:
-            print("[agent] WARNING: could not verify auth", file=sys.stderr)
-    except Exception as e:
-        print(f"[agent] ERROR: moltbook auth failed: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    print("[agent] starting autonomous loop\n")
-
-    engaged_ids: set = set()
-    last_post_time = 0.0
-    cycle = 0
-
-    while not _shutdown:
-        cycle += 1
-        print(f"[agent] ── cycle {cycle} ──")
-
-        # 1. Discover posts
-        posts = discover_posts(session, cfg, engaged_ids)
-        print(f"[agent] found {len(posts)} candidate posts")
-
-        # 2. Pick and act
-        if posts and not _shutdown:
-            n = pick_and_act(session, cfg, posts, engaged_ids)
-            print(f"[agent] took {n} actions")
+        # Verify moltbook auth
+        try:
+            me = await api_get(api_client, "/agents/me")
+            if me:
+                print(f"[agent] authenticated as: {me.get('username', '?')}")
+            else:
+                print("[agent] WARNING: could not verify auth", file=sys.stderr)
+        except Exception as e:
+            print(f"[agent] ERROR: moltbook auth failed: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        print("[agent] starting autonomous loop\n")
+
+        engaged_ids = EngagedIds()
+        last_post_time = 0.0
+        cycle = 0
+
+        while not _shutdown_event.is_set():
+            cycle += 1
+            print(f"[agent] ── cycle {cycle} ──")
+
+            # 1. Discover posts
+            posts = await discover_posts(api_client, cfg, engaged_ids)
+            print(f"[agent] found {len(posts)} candidate posts")
+
+            # 2. Decide and act — engagement plus any new post, one LLM call
+            if not _shutdown_event.is_set():
+                n, last_post_time = await decide_and_act(
+                    api_client, llm_client, cfg, posts, engaged_ids, last_post_time
+                )
+                print(f"[agent] took {n} actions")
+
+            # 3. Sleep
+            interval = cfg.get("cycle_interval_seconds", 300)
+            print(f"[agent] sleeping {interval}s …\n")
+            await _interruptible_sleep(interval)
 
-        # 3. Maybe create a post
-        if not _shutdown:
-            last_post_time = maybe_create_post(session, cfg, last_post_time)
+    print("[agent] shut down gracefully")
 
-        # 4. Sleep
-        interval = cfg.get("cycle_interval_seconds", 300)
-        print(f"[agent] sleeping {interval}s …\n")
-        _interruptible_sleep(interval)
 
-    print("[agent] shut down gracefully")
+def main():
+    asyncio.run(_main_async())
 
 
 if __name__ == "__main__":